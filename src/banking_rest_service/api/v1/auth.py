@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from banking_rest_service.core.security import hash_password
+from banking_rest_service.core.security import hash_password, password_hashing_limiter
 from banking_rest_service.db.deps import get_db
+from banking_rest_service.db.dialect import insert
 from banking_rest_service.models.user import AccountHolder, AuthUser
 from banking_rest_service.schemas.user import AccountHolderWithUser, AuthUserCreate
 
@@ -16,32 +19,36 @@ router = APIRouter()
     response_model=AccountHolderWithUser,
     status_code=status.HTTP_201_CREATED,
 )
-def signup(payload: AuthUserCreate, db: Session = Depends(get_db)) -> AccountHolderWithUser:
+async def signup(payload: AuthUserCreate, db: AsyncSession = Depends(get_db)) -> Response:
     """
     Create a new AuthUser + AccountHolder.
 
     - Fails with 400 if the email is already taken.
     - Returns the created account holder along with the auth user data.
     """
-    # Check if email already exists
-    existing = db.query(AuthUser).filter(AuthUser.email == payload.email).first()
-    if existing:
+    # bcrypt is CPU-bound; hash off the event loop so other requests keep being served
+    hashed_password = await anyio.to_thread.run_sync(
+        hash_password,
+        payload.password,
+        limiter=password_hashing_limiter,
+    )
+
+    # Create AuthUser unless the email is taken - one atomic round trip, no check-then-insert race
+    user = await db.scalar(
+        insert(AuthUser)
+        .values(email=payload.email, hashed_password=hashed_password)
+        .on_conflict_do_nothing(index_elements=[func.lower(AuthUser.email)])
+        .returning(AuthUser)
+    )
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A user with this email already exists.",
         )
 
-    # Create AuthUser
-    user = AuthUser(
-        email=payload.email,
-        hashed_password=hash_password(payload.password),
-    )
-    db.add(user)
-    db.flush()  # get user.id without committing yet
-
     # Create AccountHolder
     holder = AccountHolder(
-        user_id=user.id,
+        user=user,  # the unit of work fills user_id; no separate flush needed
         first_name=payload.first_name,
         last_name=payload.last_name,
         date_of_birth=payload.date_of_birth,
@@ -50,9 +57,15 @@ def signup(payload: AuthUserCreate, db: Session = Depends(get_db)) -> AccountHol
         email=payload.email,  # contact email = login email at creation
     )
     db.add(holder)
-    db.commit()
-    db.refresh(holder)
-    db.refresh(user)
+    await db.commit()
 
-    holder.user = user
-    return AccountHolderWithUser.model_validate(holder)
+    # Values were just written and read back by us; skip re-validating them
+    response = AccountHolderWithUser.from_orm_trusted(holder)
+    # Serialize straight to JSON bytes in pydantic-core. Returning the model would make FastAPI
+    # dump it to a dict of JSON-compatible values first and then run json.dumps over that dict.
+    # response_model still documents the body in OpenAPI.
+    return Response(
+        content=response.__pydantic_serializer__.to_json(response),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
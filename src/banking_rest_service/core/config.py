@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    Deployment settings, read once from environment variables at startup.
+
+    Each field maps to the upper-cased variable name, e.g. `BCRYPT_COST=13`.
+    """
+
+    model_config = SettingsConfigDict(frozen=True)
+
+    app_title: str = "Banking REST Service"
+    app_version: str = "0.1.0"
+
+    # SQLite by default; "postgresql+psycopg://..." is supported with the `postgres` extra
+    database_url: str = "sqlite+aiosqlite:///./bank.db"
+    # Connection pool tuning: keep connections checked in between requests instead of reopening them
+    db_pool_size: int = Field(default=20, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_recycle_seconds: int = 3600
+    # PostgreSQL (psycopg) only: executions before a statement gets a server-side prepared plan
+    db_prepare_threshold: int = Field(default=5, ge=0)
+
+    # Work factor (log2 rounds) for bcrypt; re-tune per hardware generation
+    bcrypt_cost: int = Field(default=12, ge=4, le=31)
+    # Measure hash latency at startup and pick the cost instead (overrides `bcrypt_cost`)
+    bcrypt_calibrate: bool = False
+
+    # Build read schemas from ORM objects without re-validating them; disable to debug bad data
+    trust_db: bool = True
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings instance."""
+    return Settings()
+
+
+settings = get_settings()
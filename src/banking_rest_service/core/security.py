@@ -1,17 +1,112 @@
 from __future__ import annotations
 
-from passlib.context import CryptContext
+import base64
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 
-# Configure Passlib for bcrypt hashing
-# Mark older password hashing schemes as deprecated if a newer, stronger scheme is available in the context.
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import anyio
+import bcrypt
+
+from banking_rest_service.core.config import settings
+
+# Salt layout is "$2b$<cost>$" + 22 chars of bcrypt-base64; the prefix only changes with the cost.
+_BCRYPT_SALT_PREFIX = b"$2b$%02d$" % settings.bcrypt_cost
+# bcrypt uses its own base64 alphabet ("./A-Za-z0-9") instead of the standard one.
+_BCRYPT_B64_TABLE = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+)
+
+# bcrypt only looks at the first 72 bytes of the password.
+# Truncate explicitly (as passlib did) since bcrypt>=5 rejects longer input.
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Startup calibration: the cheapest cost whose hash takes at least this long on the current host
+BCRYPT_CALIBRATION_TARGET_SECONDS = 0.25
+BCRYPT_CALIBRATION_COSTS = range(10, 16)
+
+# Dedicated limiter for bcrypt work offloaded to threads, so CPU-bound hashing
+# never exceeds the core count nor starves the default AnyIO threadpool.
+password_hashing_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+# Recently verified credentials, so repeated checks within a session skip bcrypt.
+# Keys are HMACs under a per-process random key (the plaintext is never kept);
+# values are monotonic expiry times. Only successful verifications are cached.
+VERIFY_CACHE_MAXSIZE = 1024
+VERIFY_CACHE_TTL_SECONDS = 60.0
+_verify_cache_key = secrets.token_bytes(32)
+_verify_cache: OrderedDict[bytes, float] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def _encode_password(password: str) -> bytes:
+    """Encode a plain-text password into the bytes bcrypt operates on."""
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def _gensalt(prefix: bytes | None = None) -> bytes:
+    """Build a bcrypt salt from the precomputed prefix and 16 fresh random bytes."""
+    random_part = base64.b64encode(secrets.token_bytes(16)).translate(_BCRYPT_B64_TABLE)[:22]
+    return (prefix or _BCRYPT_SALT_PREFIX) + random_part
+
+
+def set_bcrypt_cost(cost: int) -> None:
+    """Use the given work factor for all subsequently created hashes."""
+    global _BCRYPT_SALT_PREFIX
+    if not 4 <= cost <= 31:
+        raise ValueError(f"bcrypt cost must be between 4 and 31, got {cost}")
+    _BCRYPT_SALT_PREFIX = b"$2b$%02d$" % cost
+
+
+def calibrate_bcrypt_cost(
+    target_seconds: float = BCRYPT_CALIBRATION_TARGET_SECONDS,
+    costs: Iterable[int] = BCRYPT_CALIBRATION_COSTS,
+) -> int:
+    """
+    Return the first cost whose hash takes at least `target_seconds` on this host.
+
+    Falls back to the highest candidate when none reaches the target.
+    """
+    cost = settings.bcrypt_cost
+    for cost in costs:
+        started = time.perf_counter()
+        bcrypt.hashpw(b"bench", _gensalt(b"$2b$%02d$" % cost))
+        if time.perf_counter() - started >= target_seconds:
+            break
+    return cost
 
 
 def hash_password(password: str) -> str:
     """Hash a plain-text password using bcrypt."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_encode_password(password), _gensalt()).decode("ascii")
+
+
+def _verify_cache_entry(plain_password: str, hashed_password: str) -> bytes:
+    """Derive the cache key for a password/hash pair; a changed hash yields a new key."""
+    message = hashed_password.encode("ascii") + b"\0" + _encode_password(plain_password)
+    return hmac.new(_verify_cache_key, message, "sha256").digest()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify that a plain-text password matches the stored hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    entry = _verify_cache_entry(plain_password, hashed_password)
+    now = time.monotonic()
+    with _verify_cache_lock:
+        expires_at = _verify_cache.pop(entry, None)
+        if expires_at is not None and expires_at > now:
+            _verify_cache[entry] = expires_at  # re-insert as most recently used
+            return True
+
+    if not bcrypt.checkpw(_encode_password(plain_password), hashed_password.encode("ascii")):
+        return False
+
+    with _verify_cache_lock:
+        _verify_cache[entry] = now + VERIFY_CACHE_TTL_SECONDS
+        while len(_verify_cache) > VERIFY_CACHE_MAXSIZE:
+            _verify_cache.popitem(last=False)
+    return True
@@ -1,5 +1,9 @@
+from typing import Any
+
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
-    pass
+    # Timestamps are generated by the database; fetch them via RETURNING on INSERT/UPDATE
+    # so they never need a lazy reload (which an AsyncSession cannot do implicitly).
+    __mapper_args__: Any = {"eager_defaults": True}
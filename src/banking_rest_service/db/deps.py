@@ -1,16 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from banking_rest_service.db.session import SessionLocal
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Yield a database session for use in FastAPI dependencies."""
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session for use in FastAPI dependencies."""
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
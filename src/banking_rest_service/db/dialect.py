@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from banking_rest_service.db.session import engine
+
+
+def insert(table: Any) -> postgresql.Insert | sqlite.Insert:
+    """Build an INSERT supporting ON CONFLICT clauses for the configured database backend."""
+    if engine.dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Date, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import GenericFunction
+
+
+class utc_now(GenericFunction[Any]):
+    """
+    Current UTC timestamp, as precise as the backend allows.
+
+    SQLite's CURRENT_TIMESTAMP only has whole seconds, so it renders a millisecond-precision
+    UTC timestamp there instead; PostgreSQL keeps `now()` (a timestamptz).
+    """
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+class utc_today(GenericFunction[Any]):
+    """
+    Current date in UTC.
+
+    PostgreSQL's CURRENT_DATE follows the session TimeZone, so it is derived from `now()`
+    in UTC instead; SQLite's CURRENT_DATE is already UTC.
+    """
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _utc_now_default(element: utc_now, compiler: SQLCompiler, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "postgresql")
+def _utc_now_postgresql(element: utc_now, compiler: SQLCompiler, **kw: Any) -> str:
+    return "now()"
+
+
+@compiles(utc_now, "sqlite")
+def _utc_now_sqlite(element: utc_now, compiler: SQLCompiler, **kw: Any) -> str:
+    return "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(utc_today)
+def _utc_today_default(element: utc_today, compiler: SQLCompiler, **kw: Any) -> str:
+    return "CURRENT_DATE"
+
+
+@compiles(utc_today, "postgresql")
+def _utc_today_postgresql(element: utc_today, compiler: SQLCompiler, **kw: Any) -> str:
+    return "(now() AT TIME ZONE 'UTC')::date"
@@ -1,15 +1,36 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Any
 
-DATABASE_URL = "sqlite:///./bank.db"  # or from env
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # needed for SQLite + FastAPI
-)
+from banking_rest_service.core.config import settings
+
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Pick connection and pool settings for the given database URL."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        connect_args: dict[str, Any] = {"check_same_thread": False}  # needed for SQLite + FastAPI
+        if url.database in (None, "", ":memory:"):
+            # An in-memory SQLite database lives inside a single connection, so it must be shared
+            return {"connect_args": connect_args, "poolclass": StaticPool}
+    else:
+        # psycopg: switch a statement to a server-side prepared plan after it ran this many times
+        connect_args = {"prepare_threshold": settings.db_prepare_threshold}
+    return {
+        "connect_args": connect_args,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+
+engine = create_async_engine(settings.database_url, **_engine_options(settings.database_url))
 
-SessionLocal = sessionmaker(
+SessionLocal = async_sessionmaker(
     bind=engine,
-    autocommit=False,
     autoflush=False,
+    expire_on_commit=False,  # committed objects keep their loaded state; no reload SELECTs
 )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class EnumCode(TypeDecorator[Enum]):
+    """
+    Store an Enum as a compact SMALLINT code instead of its string value.
+
+    Codes come from an explicit `{member: code}` mapping covering every member, so reordering
+    or inserting members never remaps stored rows; a code must never be changed or reused.
+    Python code keeps working with the Enum members (plain values are accepted on bind).
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[Enum], codes: Mapping[Any, int]) -> None:
+        super().__init__()
+        missing = [member.name for member in enum_cls if member not in codes]
+        if missing:
+            raise ValueError(f"{enum_cls.__name__} members without a code: {', '.join(missing)}")
+        if len(set(codes.values())) != len(codes):
+            raise ValueError(f"{enum_cls.__name__} codes must be unique")
+        self.enum_cls = enum_cls
+        # Kept as a tuple so the type stays hashable for SQLAlchemy's statement cache key
+        self.codes = tuple((enum_cls(member), code) for member, code in codes.items())
+        self._codes = dict(self.codes)
+        self._members = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        return self._codes[self.enum_cls(value)]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> Enum | None:
+        if value is None:
+            return None
+        try:
+            return self._members[value]
+        except KeyError:
+            raise ValueError(f"Unknown {self.enum_cls.__name__} code in database: {value!r}") from None
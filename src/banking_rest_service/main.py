@@ -1,12 +1,38 @@
 from __future__ import annotations
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio
 from fastapi import FastAPI
 
 from banking_rest_service.api.v1 import auth as auth_routes
+from banking_rest_service.core.config import settings
+from banking_rest_service.core.security import calibrate_bcrypt_cost, password_hashing_limiter, set_bcrypt_cost
+from banking_rest_service.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Calibrate bcrypt on startup (if enabled) and close pooled database connections on shutdown."""
+    if settings.bcrypt_calibrate:
+        # Hashes at up to the highest candidate cost; keep the event loop free meanwhile
+        cost = await anyio.to_thread.run_sync(calibrate_bcrypt_cost, limiter=password_hashing_limiter)
+        set_bcrypt_cost(cost)
+        logger.info("bcrypt cost calibrated to %d", cost)
+    else:
+        logger.info("bcrypt cost set to %d", settings.bcrypt_cost)
+    yield
+    await engine.dispose()
+
 
 app = FastAPI(
-    title="Banking REST Service",
-    version="0.1.0",
+    title=settings.app_title,
+    version=settings.app_version,
+    lifespan=lifespan,
 )
 
 
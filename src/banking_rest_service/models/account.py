@@ -7,8 +7,9 @@ from typing import TYPE_CHECKING
 from sqlalchemy import BigInteger, CheckConstraint, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from banking_rest_service.core.create_timestamp import create_timestamp
 from banking_rest_service.db.base import Base
+from banking_rest_service.db.functions import utc_now
+from banking_rest_service.db.types import EnumCode
 
 if TYPE_CHECKING:
     from banking_rest_service.models.transaction import JournalEntryLine, Transfer
@@ -26,16 +27,16 @@ class Currency(Base):
 
     __tablename__ = "currencies"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     code: Mapped[str] = mapped_column(String(3), nullable=False, unique=True, index=True)  # ISO 4217 alpha-3
     name: Mapped[str] = mapped_column(String(64), nullable=False)
     minor_unit: Mapped[int] = mapped_column(Integer, nullable=False, default=2)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=create_timestamp)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
-        onupdate=create_timestamp,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
@@ -48,6 +49,14 @@ class AccountType(str, Enum):
     TERM_DEPOSIT = "TERM_DEPOSIT"
 
 
+# Stored SMALLINT codes for this module's enums (see EnumCode): never change or reuse a code
+ACCOUNT_TYPE_CODES: dict[AccountType, int] = {
+    AccountType.CURRENT: 0,
+    AccountType.SAVINGS: 1,
+    AccountType.TERM_DEPOSIT: 2,
+}
+
+
 class AccountProduct(Base):
     """
     Catalog of account products (e.g. current account, savings).
@@ -56,17 +65,19 @@ class AccountProduct(Base):
 
     __tablename__ = "account_products"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     code: Mapped[str] = mapped_column(String(32), nullable=False, unique=True, index=True)
     name: Mapped[str] = mapped_column(String(128), nullable=False)
-    account_type: Mapped[str] = mapped_column(String(32), nullable=False, default=AccountType.CURRENT.value)
+    account_type: Mapped[AccountType] = mapped_column(
+        EnumCode(AccountType, ACCOUNT_TYPE_CODES), nullable=False, default=AccountType.CURRENT
+    )
     interest_rate_basis_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=create_timestamp)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
-        onupdate=create_timestamp,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
@@ -80,6 +91,14 @@ class AccountStatus(str, Enum):
     CLOSED = "CLOSED"
 
 
+ACCOUNT_STATUS_CODES: dict[AccountStatus, int] = {
+    AccountStatus.PENDING: 0,
+    AccountStatus.ACTIVE: 1,
+    AccountStatus.BLOCKED: 2,
+    AccountStatus.CLOSED: 3,
+}
+
+
 class Account(Base):
     """
     Customer-facing deposit account.
@@ -89,7 +108,7 @@ class Account(Base):
 
     __tablename__ = "accounts"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     holder_id: Mapped[int] = mapped_column(
         ForeignKey("account_holders.id", ondelete="RESTRICT", onupdate="CASCADE"),
         nullable=False,
@@ -107,15 +126,17 @@ class Account(Base):
     account_number: Mapped[str] = mapped_column(String(34), nullable=False, unique=True, index=True)
     iban: Mapped[str | None] = mapped_column(String(34), nullable=True, unique=True)
     # Index added for faster lookups by account type in reporting
-    status: Mapped[str] = mapped_column(String(16), nullable=False, default=AccountStatus.PENDING.value, index=True)
+    status: Mapped[AccountStatus] = mapped_column(
+        EnumCode(AccountStatus, ACCOUNT_STATUS_CODES), nullable=False, default=AccountStatus.PENDING, index=True
+    )
     balance_minor: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     overdraft_limit_minor: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=create_timestamp)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
-        onupdate=create_timestamp,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
@@ -4,28 +4,48 @@ from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, CheckConstraint, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, CheckConstraint, Date, DateTime, ForeignKey, Identity, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from banking_rest_service.core.create_timestamp import create_timestamp
 from banking_rest_service.db.base import Base
+from banking_rest_service.db.functions import utc_now, utc_today
+from banking_rest_service.db.types import EnumCode
 
 if TYPE_CHECKING:
     from banking_rest_service.models.account import Account
     from banking_rest_service.models.user import AuthUser
 
 
+# 64-bit ids for the high-volume ledger tables. SQLite only auto-increments an
+# INTEGER PRIMARY KEY (which is 64-bit there anyway), hence the variant.
+LedgerId = BigInteger().with_variant(Integer, "sqlite")
+
+
 class EntryStatus(str, Enum):
     PENDING = "PENDING"
     POSTED = "POSTED"
     REVERSED = "REVERSED"
 
 
+# Stored SMALLINT codes for this module's enums (see EnumCode): never change or reuse a code
+ENTRY_STATUS_CODES: dict[EntryStatus, int] = {
+    EntryStatus.PENDING: 0,
+    EntryStatus.POSTED: 1,
+    EntryStatus.REVERSED: 2,
+}
+
+
 class LineDirection(str, Enum):
     DEBIT = "DEBIT"
     CREDIT = "CREDIT"
 
 
+LINE_DIRECTION_CODES: dict[LineDirection, int] = {
+    LineDirection.DEBIT: 0,
+    LineDirection.CREDIT: 1,
+}
+
+
 class EntryType(str, Enum):
     TRANSFER = "TRANSFER"
     CASH_DEPOSIT = "CASH_DEPOSIT"
@@ -35,6 +55,16 @@ class EntryType(str, Enum):
     ADJUSTMENT = "ADJUSTMENT"
 
 
+ENTRY_TYPE_CODES: dict[EntryType, int] = {
+    EntryType.TRANSFER: 0,
+    EntryType.CASH_DEPOSIT: 1,
+    EntryType.CASH_WITHDRAWAL: 2,
+    EntryType.FEE: 3,
+    EntryType.INTEREST: 4,
+    EntryType.ADJUSTMENT: 5,
+}
+
+
 class JournalEntry(Base):
     """
     One accounting event (double-entry).
@@ -43,10 +73,14 @@ class JournalEntry(Base):
 
     __tablename__ = "journal_entries"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    entry_type: Mapped[str] = mapped_column(String(32), nullable=False, default=EntryType.TRANSFER.value)
-    status: Mapped[str] = mapped_column(String(16), nullable=False, default=EntryStatus.PENDING.value)
-    booking_date: Mapped[date] = mapped_column(Date, nullable=False, default=lambda: create_timestamp().date())
+    id: Mapped[int] = mapped_column(LedgerId, Identity(always=True, cache=1000), primary_key=True)
+    entry_type: Mapped[EntryType] = mapped_column(
+        EnumCode(EntryType, ENTRY_TYPE_CODES), nullable=False, default=EntryType.TRANSFER
+    )
+    status: Mapped[EntryStatus] = mapped_column(
+        EnumCode(EntryStatus, ENTRY_STATUS_CODES), nullable=False, default=EntryStatus.PENDING
+    )
+    booking_date: Mapped[date] = mapped_column(Date, nullable=False, server_default=utc_today())
     value_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     external_reference: Mapped[str | None] = mapped_column(String(64), nullable=True)
     description: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -57,13 +91,13 @@ class JournalEntry(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
+        server_default=utc_now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
-        onupdate=create_timestamp,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
@@ -76,18 +110,21 @@ class JournalEntryLine(Base):
 
     __tablename__ = "journal_entry_lines"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(LedgerId, Identity(always=True, cache=1000), primary_key=True)
     entry_id: Mapped[int] = mapped_column(
+        BigInteger,
         ForeignKey("journal_entries.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
         index=True,
     )
+    # Indexed via ix_journal_entry_lines_balance below (leading column)
     account_id: Mapped[int] = mapped_column(
         ForeignKey("accounts.id", ondelete="RESTRICT", onupdate="CASCADE"),
         nullable=False,
-        index=True,
     )
-    direction: Mapped[str] = mapped_column(String(6), nullable=False, default=LineDirection.DEBIT.value)
+    direction: Mapped[LineDirection] = mapped_column(
+        EnumCode(LineDirection, LINE_DIRECTION_CODES), nullable=False, default=LineDirection.DEBIT
+    )
     # Monetary amount in minor units (e.g. cents)
     amount_minor: Mapped[int] = mapped_column(BigInteger, nullable=False)
     # For simplicity, we rely on Account.currency but keep value_date here too:
@@ -96,14 +133,20 @@ class JournalEntryLine(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
+        server_default=utc_now(),
     )
 
     # Relationships
     entry: Mapped["JournalEntry"] = relationship(back_populates="lines")
     account: Mapped["Account"] = relationship(back_populates="journal_lines")
 
-    __table_args__ = (CheckConstraint("amount_minor > 0", name="ck_journal_entry_lines_amount_positive"),)
+    __table_args__ = (
+        CheckConstraint("amount_minor > 0", name="ck_journal_entry_lines_amount_positive"),
+        # Covering index for balance queries per account (and date range): they are answered
+        # from the index alone. entry_id lets them join the parent entry (to filter on its
+        # status) without reading the line rows. amount_minor is a key column since SQLite has no INCLUDE.
+        Index("ix_journal_entry_lines_balance", "account_id", "value_date", "direction", "amount_minor", "entry_id"),
+    )
 
 
 class TransferStatus(str, Enum):
@@ -112,6 +155,13 @@ class TransferStatus(str, Enum):
     FAILED = "FAILED"
 
 
+TRANSFER_STATUS_CODES: dict[TransferStatus, int] = {
+    TransferStatus.PENDING: 0,
+    TransferStatus.EXECUTED: 1,
+    TransferStatus.FAILED: 2,
+}
+
+
 # For now we assume same currency as the accounts; later we could add currency_id if needed.
 class Transfer(Base):
     """
@@ -121,7 +171,7 @@ class Transfer(Base):
 
     __tablename__ = "transfers"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(LedgerId, Identity(always=True, cache=1000), primary_key=True)
     from_account_id: Mapped[int] = mapped_column(
         ForeignKey("accounts.id", ondelete="RESTRICT", onupdate="CASCADE"),
         nullable=False,
@@ -134,15 +184,18 @@ class Transfer(Base):
     )
     # Intended amount in minor units
     amount_minor: Mapped[int] = mapped_column(BigInteger, nullable=False)
-    status: Mapped[str] = mapped_column(String(16), nullable=False, default=TransferStatus.PENDING.value)
+    status: Mapped[TransferStatus] = mapped_column(
+        EnumCode(TransferStatus, TRANSFER_STATUS_CODES), nullable=False, default=TransferStatus.PENDING
+    )
     failure_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
     # Link to the journal entry that executed this transfer
     journal_entry_id: Mapped[int | None] = mapped_column(
+        BigInteger,
         ForeignKey("journal_entries.id", ondelete="SET NULL", onupdate="CASCADE"),
         nullable=True,
         index=True,
     )
-    requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=create_timestamp)
+    requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=utc_now())
     executed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     description: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
@@ -1,49 +1,79 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, String, column, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from banking_rest_service.core.create_timestamp import create_timestamp
 from banking_rest_service.db.base import Base
+from banking_rest_service.db.functions import utc_now
+from banking_rest_service.db.types import EnumCode
 
 if TYPE_CHECKING:
     from banking_rest_service.models.account import Account
 
 
+class PasswordAlgorithm(str, Enum):
+    BCRYPT = "bcrypt"
+
+
+# Stored SMALLINT codes for this module's enums (see EnumCode): never change or reuse a code
+PASSWORD_ALGORITHM_CODES: dict[PasswordAlgorithm, int] = {
+    PasswordAlgorithm.BCRYPT: 0,
+}
+
+
 class AuthUser(Base):
     """Authentication user for the banking REST service."""
 
     __tablename__ = "auth_users"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    email: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Stored lower-cased (see AuthUserCreate); uniqueness is enforced by ix_auth_users_email_lower
+    email: Mapped[str] = mapped_column(String(254), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
-    password_algo: Mapped[str] = mapped_column(String, nullable=False, default="bcrypt")
+    password_algo: Mapped[PasswordAlgorithm] = mapped_column(
+        EnumCode(PasswordAlgorithm, PASSWORD_ALGORITHM_CODES), nullable=False, default=PasswordAlgorithm.BCRYPT
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     is_locked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     failed_login_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=create_timestamp)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
-        onupdate=create_timestamp,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
     account_holder: Mapped["AccountHolder"] = relationship("AccountHolder", back_populates="user", uselist=False)
 
+    __table_args__ = (Index("ix_auth_users_email_lower", func.lower(column("email")), unique=True),)
+
+
+class KycStatus(str, Enum):
+    PENDING = "PENDING"
+    VERIFIED = "VERIFIED"
+    REJECTED = "REJECTED"
+
+
+KYC_STATUS_CODES: dict[KycStatus, int] = {
+    KycStatus.PENDING: 0,
+    KycStatus.VERIFIED: 1,
+    KycStatus.REJECTED: 2,
+}
+
 
 class AccountHolder(Base):
     """Account holder information linked to an authentication user."""
 
     __tablename__ = "account_holders"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(
         ForeignKey("auth_users.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
@@ -62,15 +92,19 @@ class AccountHolder(Base):
     city: Mapped[str | None] = mapped_column(String, nullable=True)
     postal_code: Mapped[str | None] = mapped_column(String, nullable=True)
     country_code: Mapped[str | None] = mapped_column(String(2), nullable=True)
-    kyc_status: Mapped[str] = mapped_column(String, nullable=False, default="PENDING")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=create_timestamp)
+    kyc_status: Mapped[KycStatus] = mapped_column(
+        EnumCode(KycStatus, KYC_STATUS_CODES), nullable=False, default=KycStatus.PENDING
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=create_timestamp,
-        onupdate=create_timestamp,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
-    user: Mapped[AuthUser] = relationship("AuthUser", back_populates="account_holder")
+    # Always serialized with the holder (AccountHolderWithUser); load it eagerly in one batched
+    # SELECT per query instead of one lazy load per holder (lazy loads also fail under AsyncSession)
+    user: Mapped[AuthUser] = relationship("AuthUser", back_populates="account_holder", lazy="selectin")
     accounts: Mapped[list["Account"]] = relationship("Account", back_populates="holder")
@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
 
-from banking_rest_service.models.account import AccountStatus
+from banking_rest_service.models.account import AccountStatus, AccountType
+from banking_rest_service.schemas.base import ReadModel
 
 
 # Currency Schemas
@@ -30,20 +31,20 @@ class CurrencyBase(BaseModel):
     )
 
 
-class CurrencyRead(CurrencyBase):
+class CurrencyRead(CurrencyBase, ReadModel):
     """Schema for reading currency details from the API."""
 
-    id: int = Field(..., description="Internal identifier of the currency.")
+    id: PositiveInt = Field(..., description="Internal identifier of the currency.")
     created_at: datetime = Field(..., description="Timestamp when the currency was created.")
     updated_at: datetime = Field(..., description="Timestamp when the currency was last updated.")
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Account Product Schemas
 class AccountProductBase(BaseModel):
     """Base schema for account product definitions."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     code: str = Field(
         ...,
         description="Internal product code.",
@@ -55,7 +56,7 @@ class AccountProductBase(BaseModel):
         description="Human-readable product name.",
         examples=["Standard Current Account", "Basic Savings Account"],
     )
-    account_type: str = Field(
+    account_type: AccountType = Field(
         ...,
         description="Logical account type.",
         examples=["CURRENT", "SAVINGS"],
@@ -68,19 +69,19 @@ class AccountProductBase(BaseModel):
     )
 
 
-class AccountProductRead(AccountProductBase):
+class AccountProductRead(AccountProductBase, ReadModel):
     """Schema for reading account product details from the API."""
 
-    id: int = Field(..., description="Internal identifier of the account product.")
+    id: PositiveInt = Field(..., description="Internal identifier of the account product.")
     created_at: datetime = Field(..., description="Timestamp when the product was created.")
     updated_at: datetime = Field(..., description="Timestamp when the product was last updated.")
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class AccountBase(BaseModel):
     """Base schema for account data exposed to API clients."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     account_number: str = Field(
         ...,
         description="Bank account number assigned by the system.",
@@ -93,8 +94,8 @@ class AccountBase(BaseModel):
         examples=["PL12105000997603123456789123", None],
         max_length=34,
     )
-    status: str = Field(
-        AccountStatus.PENDING.value,
+    status: AccountStatus = Field(
+        AccountStatus.PENDING,
         description="Lifecycle status of the account.",
         examples=[AccountStatus.ACTIVE.value],
     )
@@ -114,17 +115,17 @@ class AccountBase(BaseModel):
 class AccountCreate(BaseModel):
     """Schema for creating a new account for an existing account holder."""
 
-    holder_id: int = Field(
+    holder_id: PositiveInt = Field(
         ...,
         description="Identifier of the account holder who will own the account.",
         examples=[1],
     )
-    product_id: int = Field(
+    product_id: PositiveInt = Field(
         ...,
         description="Identifier of the account product to use.",
         examples=[1],
     )
-    currency_id: int = Field(
+    currency_id: PositiveInt = Field(
         ...,
         description="Identifier of the currency for the account.",
         examples=[1],
@@ -143,22 +144,22 @@ class AccountCreate(BaseModel):
     )
 
 
-class AccountRead(AccountBase):
+class AccountRead(AccountBase, ReadModel):
     """Schema for reading account details from the API."""
 
-    id: int = Field(..., description="Internal identifier of the account.")
-    holder_id: int = Field(..., description="Identifier of the account holder.")
-    product_id: int = Field(..., description="Identifier of the account product.")
-    currency_id: int = Field(..., description="Identifier of the account currency.")
+    id: PositiveInt = Field(..., description="Internal identifier of the account.")
+    holder_id: PositiveInt = Field(..., description="Identifier of the account holder.")
+    product_id: PositiveInt = Field(..., description="Identifier of the account product.")
+    currency_id: PositiveInt = Field(..., description="Identifier of the account currency.")
     created_at: datetime = Field(..., description="Timestamp when the account was created.")
     updated_at: datetime = Field(..., description="Timestamp when the account was last updated.")
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class AccountWithDetails(AccountRead):
     """Schema for reading account details including related product and currency."""
 
+    nested_schemas = {"product": AccountProductRead, "currency": CurrencyRead}
+
     product: AccountProductRead | None = Field(
         None,
         description="Account product details, if preloaded in the query.",
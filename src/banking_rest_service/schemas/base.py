@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import ClassVar, Self
+
+from pydantic import BaseModel, ConfigDict
+
+from banking_rest_service.core.config import settings
+
+
+class ReadModel(BaseModel):
+    """Base schema for reading data that is populated from ORM objects."""
+
+    # Pinned explicitly so read models keep the cheapest validation and setattr paths:
+    # unknown attributes are ignored, nested model instances are never re-validated, and
+    # instances are immutable - they are only built to be returned to clients.
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        revalidate_instances="never",
+        strict=True,
+    )
+
+    # Fields holding nested read schemas (or tuples of them), built through the same trusted path
+    nested_schemas: ClassVar[dict[str, type[ReadModel]]] = {}
+
+    @classmethod
+    def from_orm_trusted(cls, obj: object) -> Self:
+        """
+        Build the schema from an ORM object loaded from our own database, skipping validation.
+
+        Only attributes already loaded on `obj` are read (never triggering a lazy load);
+        missing optional ones keep their defaults. If a required field is not loaded (expired,
+        deferred, `load_only`), falls back to `model_validate`, which loads or rejects it
+        instead of returning an incomplete instance. Set `TRUST_DB=false` to always validate.
+        """
+        if not settings.trust_db:
+            return cls.model_validate(obj)
+
+        data = {name: value for name, value in vars(obj).items() if name in cls.model_fields}
+        if not _required_fields(cls) <= data.keys():
+            return cls.model_validate(obj)
+        for name, schema in cls.nested_schemas.items():
+            value = data.get(name)
+            if isinstance(value, list):
+                data[name] = tuple(schema.from_orm_trusted(item) for item in value)
+            elif value is not None:
+                data[name] = schema.from_orm_trusted(value)
+        return cls.model_construct(**data)
+
+
+@cache
+def _required_fields(model: type[ReadModel]) -> frozenset[str]:
+    """Names of the fields of `model` that have no default."""
+    return frozenset(name for name, field in model.model_fields.items() if field.is_required())
@@ -1,29 +1,32 @@
 from datetime import date, datetime
+from typing import TypedDict
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, TypeAdapter
 
 from banking_rest_service.models.transaction import EntryStatus, EntryType, LineDirection, TransferStatus
+from banking_rest_service.schemas.base import ReadModel
 
 
 # Journal Entry Schemas
 class JournalEntryLineBase(BaseModel):
     """Base schema for a single debit/credit line of a journal entry."""
 
-    account_id: int = Field(
+    model_config = ConfigDict(use_enum_values=True)
+
+    account_id: PositiveInt = Field(
         ...,
         description="Identifier of the account impacted by this line.",
         examples=[1001],
     )
-    direction: str = Field(
-        LineDirection.DEBIT.value,
+    direction: LineDirection = Field(
+        LineDirection.DEBIT,
         description="Direction of the line: DEBIT or CREDIT.",
         examples=[LineDirection.DEBIT.value, LineDirection.CREDIT.value],
     )
-    amount_minor: int = Field(
+    amount_minor: PositiveInt = Field(
         ...,
         description="Monetary amount in minor units (e.g. cents). Must be positive.",
         examples=[10000],
-        gt=0,
     )
     value_date: date | None = Field(
         None,
@@ -37,15 +40,18 @@ class JournalEntryLineBase(BaseModel):
     )
 
 
-class JournalEntryLineRead(JournalEntryLineBase):
+class JournalEntryLineRead(JournalEntryLineBase, ReadModel):
     """Schema for reading a single journal entry line."""
 
-    id: int = Field(
+    # Mostly served nested in JournalEntryRead; build the standalone validator on first use
+    model_config = ConfigDict(defer_build=True)
+
+    id: PositiveInt = Field(
         ...,
         description="Internal identifier of the journal entry line.",
         examples=[1],
     )
-    entry_id: int = Field(
+    entry_id: PositiveInt = Field(
         ...,
         description="Identifier of the parent journal entry.",
         examples=[500],
@@ -56,19 +62,19 @@ class JournalEntryLineRead(JournalEntryLineBase):
         examples=["2025-01-01T12:00:00Z"],
     )
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class JournalEntryBase(BaseModel):
     """Base schema for journal entries representing accounting events."""
 
-    entry_type: str = Field(
-        EntryType.TRANSFER.value,
+    model_config = ConfigDict(use_enum_values=True)
+
+    entry_type: EntryType = Field(
+        EntryType.TRANSFER,
         description="Type of the journal entry.",
         examples=[EntryType.TRANSFER.value, EntryType.FEE.value],
     )
-    status: str = Field(
-        EntryStatus.PENDING.value,
+    status: EntryStatus = Field(
+        EntryStatus.PENDING,
         description="Lifecycle status of the journal entry.",
         examples=[EntryStatus.PENDING.value, EntryStatus.POSTED.value],
     )
@@ -92,17 +98,19 @@ class JournalEntryBase(BaseModel):
         description="Free-text description of the journal entry.",
         examples=["Internal transfer between customer accounts", None],
     )
-    created_by_user_id: int | None = Field(
+    created_by_user_id: PositiveInt | None = Field(
         None,
         description="Identifier of the user who initiated the entry, if known.",
         examples=[1, None],
     )
 
 
-class JournalEntryRead(JournalEntryBase):
+class JournalEntryRead(JournalEntryBase, ReadModel):
     """Schema for reading journal entries including their lines."""
 
-    id: int = Field(
+    nested_schemas = {"lines": JournalEntryLineRead}
+
+    id: PositiveInt = Field(
         ...,
         description="Internal identifier of the journal entry.",
         examples=[500],
@@ -117,33 +125,66 @@ class JournalEntryRead(JournalEntryBase):
         description="Timestamp when the journal entry was last updated.",
         examples=["2025-01-10T09:01:00Z"],
     )
-    lines: list[JournalEntryLineRead] = Field(
-        default_factory=list,
+    lines: tuple[JournalEntryLineRead, ...] = Field(
+        (),  # shared immutable default; no empty list allocated per instance
         description="List of debit/credit lines that belong to this entry.",
+        strict=False,  # ORM relationships are lists; accept them for the tuple
     )
 
-    model_config = ConfigDict(from_attributes=True)
+
+# Plain-dict mirrors of JournalEntryRead / JournalEntryLineRead for serializing DB rows
+# (e.g. `JOURNAL_ENTRY_ADAPTER.dump_json(row)`) without instantiating a model per line.
+# The BaseModel versions stay the documented response models in OpenAPI.
+class JournalEntryLineDict(TypedDict):
+    """Plain-dict form of JournalEntryLineRead."""
+
+    account_id: int
+    direction: LineDirection
+    amount_minor: int
+    value_date: date | None
+    description: str | None
+    id: int
+    entry_id: int
+    created_at: datetime
+
+
+class JournalEntryDict(TypedDict):
+    """Plain-dict form of JournalEntryRead, with its lines."""
+
+    entry_type: EntryType
+    status: EntryStatus
+    booking_date: date
+    value_date: date | None
+    external_reference: str | None
+    description: str | None
+    created_by_user_id: int | None
+    id: int
+    created_at: datetime
+    updated_at: datetime
+    lines: list[JournalEntryLineDict]
+
+
+JOURNAL_ENTRY_ADAPTER: TypeAdapter[JournalEntryDict] = TypeAdapter(JournalEntryDict)
 
 
 # Transfer Schemas
 class TransferBase(BaseModel):
     """Base schema for money transfer between accounts."""
 
-    from_account_id: int = Field(
+    from_account_id: PositiveInt = Field(
         ...,
         description="Identifier of the source account for the transfer.",
         examples=[1001],
     )
-    to_account_id: int = Field(
+    to_account_id: PositiveInt = Field(
         ...,
         description="Identifier of the destination account for the transfer.",
         examples=[1002],
     )
-    amount_minor: int = Field(
+    amount_minor: PositiveInt = Field(
         ...,
         description="Amount to transfer in minor units (e.g. cents). Must be positive.",
         examples=[50000],  # 500.00
-        gt=0,
     )
     description: str | None = Field(
         None,
@@ -159,15 +200,20 @@ class TransferCreate(TransferBase):
     pass
 
 
-class TransferRead(TransferBase):
+TRANSFER_CREATE_LIST_ADAPTER: TypeAdapter[list[TransferCreate]] = TypeAdapter(list[TransferCreate])
+
+
+class TransferRead(TransferBase, ReadModel):
     """Schema for reading transfer details."""
 
-    id: int = Field(
+    model_config = ConfigDict(use_enum_values=True)
+
+    id: PositiveInt = Field(
         ...,
         description="Internal identifier of the transfer.",
         examples=[200],
     )
-    status: str = Field(
+    status: TransferStatus = Field(
         ...,
         description="Lifecycle status of the transfer.",
         examples=[
@@ -181,7 +227,7 @@ class TransferRead(TransferBase):
         description="Reason for transfer failure, if any.",
         examples=["Insufficient funds", None],
     )
-    journal_entry_id: int | None = Field(
+    journal_entry_id: PositiveInt | None = Field(
         None,
         description="Identifier of the journal entry that executed this transfer, if created.",
         examples=[500, None],
@@ -197,4 +243,6 @@ class TransferRead(TransferBase):
         examples=["2025-01-10T09:00:02Z", None],
     )
 
-    model_config = ConfigDict(from_attributes=True)
+
+JOURNAL_ENTRY_LIST_ADAPTER: TypeAdapter[list[JournalEntryRead]] = TypeAdapter(list[JournalEntryRead])
+TRANSFER_LIST_ADAPTER: TypeAdapter[list[TransferRead]] = TypeAdapter(list[TransferRead])
@@ -1,13 +1,65 @@
 from datetime import date, datetime
-
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import TYPE_CHECKING, Annotated, Literal
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    PositiveInt,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+)
+
+from banking_rest_service.core.countries import ISO_3166_ALPHA2_CODES
+from banking_rest_service.models.user import KycStatus
+from banking_rest_service.schemas.base import ReadModel
+
+# Format checks run inside pydantic-core as part of validation
+PhoneNumber = Annotated[str, StringConstraints(pattern=r"^\+?[0-9 ]{6,20}$")]
+NationalID = Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9\-]{4,32}$", to_upper=True)]
+PostalCode = Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9\- ]{3,12}$", to_upper=True)]
+
+if TYPE_CHECKING:
+    CountryCode = str
+else:
+    # Validated as a Literal: a single hash lookup against the ISO 3166-1 alpha-2 codes
+    CountryCode = Literal[ISO_3166_ALPHA2_CODES]
+
+# Holder fields shared by the signup request and the account holder schemas
+FIRST_NAME_FIELD = Field(
+    ...,
+    description="First name of the account holder.",
+    examples=["John"],
+)
+LAST_NAME_FIELD = Field(
+    ...,
+    description="Last name (family name) of the account holder.",
+    examples=["Doe"],
+)
+DATE_OF_BIRTH_FIELD = Field(
+    ...,
+    description="Date of birth of the account holder.",
+    examples=["1990-01-15"],
+)
+NATIONAL_ID_NUMBER_FIELD = Field(
+    ...,
+    description="National ID or government-issued identifier of the account holder.",
+    examples=["ABC123456"],
+)
+PHONE_NUMBER_FIELD = Field(
+    ...,
+    description="Primary contact phone number of the account holder.",
+    examples=["+48 123 456 789"],
+)
 
 
 # Auth User Schemas
 class AuthUserBase(BaseModel):
     """Base schema for authentication user."""
 
-    email: EmailStr = Field(
+    email: str = Field(
         ...,
         description="User email address used as the login identifier.",
         examples=["user@example.com"],
@@ -29,7 +81,7 @@ class AuthUserCreate(BaseModel):
 
     email: EmailStr = Field(
         ...,
-        description="User email address used for login.",
+        description="User email address used for login (stored lower-cased).",
         examples=["new.user@example.com"],
     )
     password: str = Field(
@@ -37,37 +89,26 @@ class AuthUserCreate(BaseModel):
         description="Plain text password; it will be hashed by the service layer.",
         examples=["S3cretP@ssword"],
     )
-    first_name: str = Field(
-        ...,
-        description="First name of the account holder.",
-        examples=["John"],
-    )
-    last_name: str = Field(
-        ...,
-        description="Last name (family name) of the account holder.",
-        examples=["Doe"],
-    )
-    date_of_birth: date = Field(
-        ...,
-        description="Date of birth of the account holder.",
-        examples=["1990-01-15"],
-    )
-    national_id_number: str = Field(
-        ...,
-        description="National ID or government-issued identifier of the account holder.",
-        examples=["ABC123456"],
-    )
-    phone_number: str = Field(
-        ...,
-        description="Primary contact phone number of the account holder.",
-        examples=["+48 123 456 789"],
-    )
+    first_name: str = FIRST_NAME_FIELD
+    last_name: str = LAST_NAME_FIELD
+    date_of_birth: date = DATE_OF_BIRTH_FIELD
+    national_id_number: NationalID = NATIONAL_ID_NUMBER_FIELD
+    phone_number: PhoneNumber = PHONE_NUMBER_FIELD
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        """Lower-case the email so lookups and the unique index treat addresses case-insensitively."""
+        return value.strip().lower()
 
 
-class AuthUserRead(AuthUserBase):
+AUTH_USER_CREATE_LIST_ADAPTER: TypeAdapter[list[AuthUserCreate]] = TypeAdapter(list[AuthUserCreate])
+
+
+class AuthUserRead(AuthUserBase, ReadModel):
     """Schema for reading authentication user data."""
 
-    id: int = Field(
+    id: PositiveInt = Field(
         ...,
         description="Internal identifier of the authentication user.",
         examples=[1],
@@ -83,44 +124,22 @@ class AuthUserRead(AuthUserBase):
         examples=["2025-01-02T09:30:00Z"],
     )
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Account Holder Schemas
 class AccountHolderBase(BaseModel):
     """Base schema for account holder."""
 
-    first_name: str = Field(
-        ...,
-        description="First name of the account holder.",
-        examples=["John"],
-    )
-    last_name: str = Field(
-        ...,
-        description="Last name (family name) of the account holder.",
-        examples=["Doe"],
-    )
-    date_of_birth: date = Field(
-        ...,
-        description="Date of birth of the account holder, if known.",
-        examples=["1990-01-15"],
-    )
-    national_id_number: str = Field(
-        ...,
-        description="National ID or government-issued identifier, if collected.",
-        examples=["ABC123456"],
-    )
-    email: EmailStr = Field(
+    first_name: str = FIRST_NAME_FIELD
+    last_name: str = LAST_NAME_FIELD
+    date_of_birth: date = DATE_OF_BIRTH_FIELD
+    national_id_number: NationalID = NATIONAL_ID_NUMBER_FIELD
+    email: str = Field(
         ...,
         description="Contact email address of the account holder (initially same as login email).",
         examples=["holder@example.com"],
     )
 
-    phone_number: str = Field(
-        ...,
-        description="Contact phone number of the account holder.",
-        examples=["+48 123 456 789", None],
-    )
+    phone_number: PhoneNumber = PHONE_NUMBER_FIELD
     address_line1: str | None = Field(
         None,
         description="First line of the account holder's address.",
@@ -136,27 +155,29 @@ class AccountHolderBase(BaseModel):
         description="City of the account holder's address.",
         examples=["Warsaw", None],
     )
-    postal_code: str | None = Field(
+    postal_code: PostalCode | None = Field(
         None,
         description="Postal code of the account holder's address.",
         examples=["00-001", None],
     )
-    country_code: str | None = Field(
+    country_code: CountryCode | None = Field(
         None,
         description="ISO 3166-1 alpha-2 country code.",
         examples=["PL", None],
     )
 
 
-class AccountHolderRead(AccountHolderBase):
+class AccountHolderRead(AccountHolderBase, ReadModel):
     """Schema for reading account holder data."""
 
-    id: int = Field(
+    model_config = ConfigDict(use_enum_values=True)
+
+    id: PositiveInt = Field(
         ...,
         description="Internal identifier of the account holder.",
         examples=[1],
     )
-    user_id: int = Field(
+    user_id: PositiveInt = Field(
         ...,
         description="Identifier of the associated authentication user.",
         examples=[1],
@@ -171,19 +192,25 @@ class AccountHolderRead(AccountHolderBase):
         description="Timestamp when the account holder record was last updated.",
         examples=["2025-01-02T09:30:00Z"],
     )
-    kyc_status: str = Field(
+    kyc_status: KycStatus = Field(
         ...,
         description="Know Your Customer (KYC) verification status.",
-        examples=["PENDING", "VERIFIED", "REJECTED"],
+        examples=[KycStatus.PENDING.value, KycStatus.VERIFIED.value, KycStatus.REJECTED.value],
     )
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class AccountHolderWithUser(AccountHolderRead):
     """Schema for reading account holder data along with associated user."""
 
+    model_config = ConfigDict(defer_build=True)
+
+    nested_schemas = {"user": AuthUserRead}
+
     user: AuthUserRead | None = Field(
         None,
         description="Authentication user associated with this account holder, if loaded.",
     )
+
+
+AUTH_USER_LIST_ADAPTER: TypeAdapter[list[AuthUserRead]] = TypeAdapter(list[AuthUserRead])
+ACCOUNT_HOLDER_LIST_ADAPTER: TypeAdapter[list[AccountHolderRead]] = TypeAdapter(list[AccountHolderRead])
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from banking_rest_service.models.transaction import EntryStatus, JournalEntry, JournalEntryLine, LineDirection
+
+
+async def insert_journal_lines(
+    db: AsyncSession, lines: Sequence[dict[str, Any]]
+) -> Sequence[tuple[int, int, int, LineDirection]]:
+    """
+    Insert the debit/credit lines of journal entries in a single statement.
+
+    Each item holds `JournalEntryLine` column values (`entry_id`, `account_id`, `direction`,
+    `amount_minor`, ...). Returns `(id, entry_id, account_id, direction)` for each created line.
+    The rows come back in no guaranteed order (e.g. on PostgreSQL), so match them to `lines`
+    by these columns rather than by position.
+    """
+    if not lines:
+        return []
+    result = await db.execute(
+        # Requesting sort_by_parameter_order would make SQLite (no insert sentinel) fall back to
+        # one INSERT per line, so the rows carry their identifying columns instead
+        insert(JournalEntryLine).returning(
+            JournalEntryLine.id,
+            JournalEntryLine.entry_id,
+            JournalEntryLine.account_id,
+            JournalEntryLine.direction,
+        ),
+        list(lines),
+    )
+    return result.tuples().all()
+
+
+async def account_balance_minor(db: AsyncSession, account_id: int) -> int:
+    """
+    Return the balance of an account in minor units, from its posted journal entry lines.
+
+    Credits count as positive and debits as negative. The sum is computed by the database
+    in a single aggregate: the lines are read from the `ix_journal_entry_lines_balance`
+    covering index alone (it includes `entry_id` for the join), each parent entry's status
+    is looked up by primary key, and no line rows are transferred to or iterated in Python.
+    """
+    signed_amount = case(
+        (JournalEntryLine.direction == LineDirection.DEBIT, -JournalEntryLine.amount_minor),
+        else_=JournalEntryLine.amount_minor,
+    )
+    balance = await db.scalar(
+        select(func.coalesce(func.sum(signed_amount), 0))
+        .join(JournalEntry, JournalEntryLine.entry_id == JournalEntry.id)
+        .where(JournalEntryLine.account_id == account_id, JournalEntry.status == EntryStatus.POSTED)
+    )
+    return int(balance or 0)
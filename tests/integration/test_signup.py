@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import banking_rest_service.models  # noqa: F401
+from banking_rest_service.core import security
+from banking_rest_service.db.base import Base
+from banking_rest_service.db.deps import get_db
+from banking_rest_service.main import app
+from banking_rest_service.models.user import AccountHolder, AuthUser
+
+SIGNUP_PAYLOAD = {
+    "email": "Alice@Example.com",
+    "password": "correct horse battery staple",
+    "first_name": "Alice",
+    "last_name": "Nowak",
+    "date_of_birth": "1990-05-17",
+    "national_id_number": "90051712345",
+    "phone_number": "+48123456789",
+}
+
+
+@pytest.fixture
+def sessions() -> async_sessionmaker[AsyncSession]:
+    """Session factory for a fresh in-memory SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def client(sessions: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """A client for the app using the in-memory database and the cheapest bcrypt cost."""
+    monkeypatch.setattr(security, "_BCRYPT_SALT_PREFIX", b"$2b$04$")
+    engine = sessions.kw["bind"]
+
+    async def create_tables() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def get_test_db() -> AsyncIterator[AsyncSession]:
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_test_db
+    with TestClient(app) as test_client:
+        test_client.portal.call(create_tables)
+        yield test_client
+        test_client.portal.call(engine.dispose)
+    app.dependency_overrides.clear()
+
+
+def test_signup_creates_user_and_holder(client: TestClient) -> None:
+    response = client.post("/auth/signup", json=SIGNUP_PAYLOAD)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["email"] == "alice@example.com"
+    assert body["first_name"] == "Alice"
+    assert body["date_of_birth"] == "1990-05-17"
+    assert body["kyc_status"] == "PENDING"
+    assert body["user_id"] == body["user"]["id"]
+    assert body["user"]["email"] == "alice@example.com"
+    assert body["user"]["is_active"] is True
+    assert {"id", "created_at", "updated_at"} <= body.keys()
+    assert {"id", "created_at", "updated_at"} <= body["user"].keys()
+    assert "password" not in body["user"] and "hashed_password" not in body["user"]
+
+
+def test_signup_stores_lower_cased_email(client: TestClient, sessions: async_sessionmaker[AsyncSession]) -> None:
+    assert client.post("/auth/signup", json=SIGNUP_PAYLOAD).status_code == 201
+
+    async def stored_emails() -> tuple[list[str], list[str]]:
+        async with sessions() as db:
+            users = list(await db.scalars(select(AuthUser.email)))
+            holders = list(await db.scalars(select(AccountHolder.email)))
+        return users, holders
+
+    assert client.portal.call(stored_emails) == (["alice@example.com"], ["alice@example.com"])
+
+
+def test_signup_rejects_email_taken_in_different_case(client: TestClient) -> None:
+    assert client.post("/auth/signup", json=SIGNUP_PAYLOAD).status_code == 201
+
+    response = client.post("/auth/signup", json={**SIGNUP_PAYLOAD, "email": "alice@example.COM"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "A user with this email already exists."}
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+
+from banking_rest_service.db.functions import utc_now, utc_today
+
+
+def test_utc_today_on_postgresql_ignores_session_time_zone() -> None:
+    assert str(utc_today().compile(dialect=postgresql.dialect())) == "(now() AT TIME ZONE 'UTC')::date"
+
+
+def test_utc_now_on_postgresql_is_now() -> None:
+    assert str(utc_now().compile(dialect=postgresql.dialect())) == "now()"
+
+
+def test_utc_now_on_sqlite_keeps_sub_second_precision() -> None:
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        raw = conn.exec_driver_sql(str(select(utc_now()).compile(engine))).scalar_one()
+        today = conn.execute(select(utc_today())).scalar_one()
+
+    assert len(raw) == len("2025-01-01 12:00:00.000")
+    now = datetime.fromisoformat(raw).replace(tzinfo=UTC)
+    assert abs((datetime.now(UTC) - now).total_seconds()) < 5
+    assert today == datetime.now(UTC).date()
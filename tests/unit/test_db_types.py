@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from enum import Enum
+
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from banking_rest_service.db.types import EnumCode
+from banking_rest_service.models.transaction import ENTRY_TYPE_CODES, EntryType
+
+DIALECT = sqlite.dialect()
+
+
+class Color(str, Enum):
+    RED = "RED"
+    GREEN = "GREEN"
+
+
+@pytest.mark.parametrize("member", list(EntryType))
+def test_enum_code_round_trip(member: EntryType) -> None:
+    column_type = EnumCode(EntryType, ENTRY_TYPE_CODES)
+
+    code = column_type.process_bind_param(member, DIALECT)
+
+    assert code == ENTRY_TYPE_CODES[member]
+    assert column_type.process_result_value(code, DIALECT) is member
+
+
+def test_enum_code_accepts_plain_values_and_none() -> None:
+    column_type = EnumCode(Color, {Color.RED: 1, Color.GREEN: 2})
+
+    assert column_type.process_bind_param("GREEN", DIALECT) == 2
+    assert column_type.process_bind_param(None, DIALECT) is None
+    assert column_type.process_result_value(None, DIALECT) is None
+
+
+def test_enum_code_uses_explicit_codes_not_declaration_order() -> None:
+    column_type = EnumCode(Color, {Color.GREEN: 7, Color.RED: 3})
+
+    assert column_type.process_bind_param(Color.RED, DIALECT) == 3
+    assert column_type.process_result_value(7, DIALECT) is Color.GREEN
+
+
+def test_enum_code_rejects_unknown_code() -> None:
+    column_type = EnumCode(Color, {Color.RED: 0, Color.GREEN: 1})
+
+    with pytest.raises(ValueError, match="Unknown Color code in database: 5"):
+        column_type.process_result_value(5, DIALECT)
+
+
+def test_enum_code_requires_a_code_per_member() -> None:
+    with pytest.raises(ValueError, match="GREEN"):
+        EnumCode(Color, {Color.RED: 0})
+
+
+def test_enum_code_rejects_duplicate_codes() -> None:
+    with pytest.raises(ValueError, match="unique"):
+        EnumCode(Color, {Color.RED: 0, Color.GREEN: 0})
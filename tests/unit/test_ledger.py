@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import banking_rest_service.models  # noqa: F401
+from banking_rest_service.db.base import Base
+from banking_rest_service.models.transaction import EntryStatus, JournalEntry, JournalEntryLine, LineDirection
+from banking_rest_service.services.ledger import account_balance_minor, insert_journal_lines
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _entry(db: AsyncSession, status: EntryStatus) -> int:
+    entry_id = await db.scalar(insert(JournalEntry).values(status=status).returning(JournalEntry.id))
+    assert entry_id is not None
+    return entry_id
+
+
+def _lines(entry_id: int) -> list[dict[str, Any]]:
+    return [
+        {"entry_id": entry_id, "account_id": account_id, "direction": direction, "amount_minor": amount}
+        for account_id, direction, amount in [
+            (1, LineDirection.DEBIT, 500),
+            (2, LineDirection.CREDIT, 500),
+            (3, LineDirection.DEBIT, 70),
+            (1, LineDirection.CREDIT, 70),
+            (2, LineDirection.DEBIT, 30),
+        ]
+    ]
+
+
+@pytest.mark.anyio
+async def test_insert_journal_lines_returns_identifying_columns(db: AsyncSession) -> None:
+    entry_id = await _entry(db, EntryStatus.POSTED)
+    lines = _lines(entry_id)
+
+    created = await insert_journal_lines(db, lines)
+
+    rows = (await db.execute(select(JournalEntryLine.id, JournalEntryLine.amount_minor))).all()
+    amounts = {row.id: row.amount_minor for row in rows}
+    by_key = {(line_entry, account, direction): amounts[line_id] for line_id, line_entry, account, direction in created}
+    assert by_key == {(line["entry_id"], line["account_id"], line["direction"]): line["amount_minor"] for line in lines}
+
+
+@pytest.mark.anyio
+async def test_insert_journal_lines_uses_a_single_insert(db: AsyncSession) -> None:
+    entry_id = await _entry(db, EntryStatus.POSTED)
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.startswith("INSERT INTO journal_entry_lines"):
+            statements.append(statement)
+
+    sync_engine = db.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        await insert_journal_lines(db, _lines(entry_id))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+
+
+@pytest.mark.anyio
+async def test_insert_journal_lines_empty(db: AsyncSession) -> None:
+    assert await insert_journal_lines(db, []) == []
+
+
+@pytest.mark.anyio
+async def test_account_balance_counts_posted_lines_only(db: AsyncSession) -> None:
+    posted = await _entry(db, EntryStatus.POSTED)
+    pending = await _entry(db, EntryStatus.PENDING)
+    await insert_journal_lines(
+        db,
+        [
+            {"entry_id": posted, "account_id": 1, "direction": LineDirection.CREDIT, "amount_minor": 1000},
+            {"entry_id": posted, "account_id": 1, "direction": LineDirection.DEBIT, "amount_minor": 250},
+            {"entry_id": posted, "account_id": 2, "direction": LineDirection.CREDIT, "amount_minor": 999},
+            {"entry_id": pending, "account_id": 1, "direction": LineDirection.CREDIT, "amount_minor": 5000},
+        ],
+    )
+
+    assert await account_balance_minor(db, 1) == 750
+    assert await account_balance_minor(db, 3) == 0
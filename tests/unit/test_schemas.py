@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, date, datetime
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+import banking_rest_service.models  # noqa: F401
+from banking_rest_service.models.transaction import EntryStatus, EntryType, LineDirection
+from banking_rest_service.models.user import AuthUser
+from banking_rest_service.schemas.transaction import (
+    JOURNAL_ENTRY_ADAPTER,
+    JOURNAL_ENTRY_LIST_ADAPTER,
+    JournalEntryDict,
+    JournalEntryLineDict,
+    JournalEntryLineRead,
+    JournalEntryRead,
+)
+from banking_rest_service.schemas.user import AuthUserRead, NationalID, PhoneNumber, PostalCode
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _user(**overrides: object) -> AuthUser:
+    values: dict[str, object] = {
+        "id": 1,
+        "email": "jan@example.com",
+        "is_active": True,
+        "is_locked": False,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    values.update(overrides)
+    return AuthUser(**values)
+
+
+def test_from_orm_trusted_matches_validated_model() -> None:
+    user = _user()
+
+    assert AuthUserRead.from_orm_trusted(user) == AuthUserRead.model_validate(user)
+
+
+def test_from_orm_trusted_validates_when_a_required_field_is_not_loaded() -> None:
+    user = _user()
+    del user.__dict__["updated_at"]  # as if expired or deferred
+
+    # Falls back to model_validate, which rejects the incomplete object instead of omitting the field
+    with pytest.raises(ValidationError, match="updated_at"):
+        AuthUserRead.from_orm_trusted(user)
+
+
+def _journal_entry_row() -> dict[str, Any]:
+    line = {
+        "entry_id": 500,
+        "value_date": None,
+        "description": None,
+        "created_at": NOW,
+    }
+    return {
+        "id": 500,
+        "entry_type": EntryType.TRANSFER,
+        "status": EntryStatus.POSTED,
+        "booking_date": date(2025, 1, 10),
+        "value_date": date(2025, 1, 10),
+        "external_reference": "EXT-REF-12345",
+        "description": "Internal transfer",
+        "created_by_user_id": None,
+        "created_at": NOW,
+        "updated_at": NOW,
+        "lines": [
+            {**line, "id": 1, "account_id": 1001, "direction": LineDirection.DEBIT, "amount_minor": 10000},
+            {**line, "id": 2, "account_id": 1002, "direction": LineDirection.CREDIT, "amount_minor": 10000},
+        ],
+    }
+
+
+def test_journal_entry_typed_dicts_mirror_read_models() -> None:
+    assert list(JournalEntryDict.__annotations__) == list(JournalEntryRead.model_fields)
+    assert list(JournalEntryLineDict.__annotations__) == list(JournalEntryLineRead.model_fields)
+
+
+def test_journal_entry_adapter_matches_read_model_json() -> None:
+    row = _journal_entry_row()
+
+    # Key order follows the input dict for the TypedDict, so compare the decoded documents
+    assert json.loads(JOURNAL_ENTRY_ADAPTER.dump_json(row)) == json.loads(
+        JournalEntryRead.model_validate(row).model_dump_json()
+    )
+
+
+def test_journal_entry_list_adapter_matches_read_model_json() -> None:
+    entry = JournalEntryRead.model_validate(_journal_entry_row())
+
+    assert JOURNAL_ENTRY_LIST_ADAPTER.dump_json([entry]) == f"[{entry.model_dump_json()}]".encode()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("+48 123 456 789", "+48 123 456 789"), ("123456", "123456")],
+)
+def test_phone_number_accepts_valid_formats(value: str, expected: str) -> None:
+    assert TypeAdapter(PhoneNumber).validate_python(value) == expected
+
+
+@pytest.mark.parametrize("value", ["12345", "+48-123-456", "call me", "1" * 21])
+def test_phone_number_rejects_invalid_formats(value: str) -> None:
+    with pytest.raises(ValidationError):
+        TypeAdapter(PhoneNumber).validate_python(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("ABC123456", "ABC123456"), ("abc1234", "ABC1234"), ("90-05-17", "90-05-17")],
+)
+def test_national_id_is_normalized_to_upper_case(value: str, expected: str) -> None:
+    assert TypeAdapter(NationalID).validate_python(value) == expected
+
+
+@pytest.mark.parametrize("value", ["AB1", "ABC 123", "ABC_123", "A" * 33])
+def test_national_id_rejects_invalid_formats(value: str) -> None:
+    with pytest.raises(ValidationError):
+        TypeAdapter(NationalID).validate_python(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("00-950", "00-950"), ("sw1a 1aa", "SW1A 1AA"), ("10115", "10115")],
+)
+def test_postal_code_is_normalized_to_upper_case(value: str, expected: str) -> None:
+    assert TypeAdapter(PostalCode).validate_python(value) == expected
+
+
+@pytest.mark.parametrize("value", ["12", "00/950", "1" * 13])
+def test_postal_code_rejects_invalid_formats(value: str) -> None:
+    with pytest.raises(ValidationError):
+        TypeAdapter(PostalCode).validate_python(value)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+
+import bcrypt
+import pytest
+
+from banking_rest_service.core import security
+
+BCRYPT_SALT_RE = re.compile(rb"^\$2b\$\d{2}\$[./A-Za-z0-9]{22}$")
+
+
+@pytest.fixture(autouse=True)
+def cheap_bcrypt(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Hash with the minimum cost and start every test with an empty verify cache."""
+    monkeypatch.setattr(security, "_BCRYPT_SALT_PREFIX", b"$2b$04$")
+    security._verify_cache.clear()
+    yield
+    security._verify_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "password",
+    ["correct horse battery staple", "zażółć gęślą jaźń", "p" * 100, "ł" * 50],
+)
+def test_hash_password_round_trip(password: str) -> None:
+    hashed = security.hash_password(password)
+
+    assert hashed.startswith("$2b$04$")
+    assert security.verify_password(password, hashed)
+    assert not security.verify_password("not the password", hashed)
+
+
+def test_password_truncated_to_72_bytes() -> None:
+    hashed = security.hash_password("a" * 72 + "tail")
+
+    # bcrypt only sees the first 72 bytes, so anything after them is ignored
+    assert security.verify_password("a" * 72 + "other tail", hashed)
+    assert not security.verify_password("a" * 71, hashed)
+
+
+def test_hash_matches_reference_bcrypt() -> None:
+    hashed = security.hash_password("zażółć")
+
+    assert bcrypt.checkpw("zażółć".encode(), hashed.encode("ascii"))
+
+
+def test_gensalt_format() -> None:
+    salt = security._gensalt()
+
+    assert BCRYPT_SALT_RE.match(salt)
+    assert salt.startswith(b"$2b$04$")
+    assert security._gensalt(b"$2b$10$").startswith(b"$2b$10$")
+    # Accepted by the reference implementation as-is
+    assert bcrypt.hashpw(b"secret", salt).startswith(salt)
+
+
+def test_gensalt_is_unique() -> None:
+    salts = {security._gensalt() for _ in range(1000)}
+
+    assert len(salts) == 1000
+
+
+def test_set_bcrypt_cost_rejects_out_of_range() -> None:
+    with pytest.raises(ValueError):
+        security.set_bcrypt_cost(3)
+    with pytest.raises(ValueError):
+        security.set_bcrypt_cost(32)
+
+
+def test_verify_cache_hit_skips_bcrypt(monkeypatch: pytest.MonkeyPatch) -> None:
+    hashed = security.hash_password("secret")
+    assert security.verify_password("secret", hashed)
+    assert len(security._verify_cache) == 1
+
+    def fail_checkpw(password: bytes, hashed_password: bytes) -> bool:
+        raise AssertionError("bcrypt should not run on a cache hit")
+
+    monkeypatch.setattr(security.bcrypt, "checkpw", fail_checkpw)
+    assert security.verify_password("secret", hashed)
+
+
+def test_verify_cache_miss_on_wrong_password_or_hash() -> None:
+    hashed = security.hash_password("secret")
+    other_hash = security.hash_password("secret")
+    assert security.verify_password("secret", hashed)
+
+    assert not security.verify_password("Secret", hashed)
+    # A new hash (e.g. after a password change) never reuses the old entry
+    assert security.verify_password("secret", other_hash)
+    assert len(security._verify_cache) == 2
+
+
+def test_failed_verification_is_not_cached() -> None:
+    hashed = security.hash_password("secret")
+
+    assert not security.verify_password("wrong", hashed)
+    assert not security._verify_cache
+
+
+def test_verify_cache_entry_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    hashed = security.hash_password("secret")
+    now = 1000.0
+    monkeypatch.setattr(security.time, "monotonic", lambda: now)
+    assert security.verify_password("secret", hashed)
+
+    calls = 0
+    checkpw = security.bcrypt.checkpw
+
+    def counting_checkpw(password: bytes, hashed_password: bytes) -> bool:
+        nonlocal calls
+        calls += 1
+        return checkpw(password, hashed_password)
+
+    monkeypatch.setattr(security.bcrypt, "checkpw", counting_checkpw)
+    now += security.VERIFY_CACHE_TTL_SECONDS - 1
+    assert security.verify_password("secret", hashed)
+    assert calls == 0
+
+    now += 1
+    assert security.verify_password("secret", hashed)
+    assert calls == 1
+
+
+def test_verify_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(security, "VERIFY_CACHE_MAXSIZE", 2)
+    hashes = {password: security.hash_password(password) for password in ("a", "b", "c")}
+
+    assert security.verify_password("a", hashes["a"])
+    assert security.verify_password("b", hashes["b"])
+    assert security.verify_password("a", hashes["a"])  # "b" is now least recently used
+    assert security.verify_password("c", hashes["c"])
+
+    assert len(security._verify_cache) == 2
+    assert security._verify_cache_entry("a", hashes["a"]) in security._verify_cache
+    assert security._verify_cache_entry("b", hashes["b"]) not in security._verify_cache
+    assert security._verify_cache_entry("c", hashes["c"]) in security._verify_cache
+
+
+@pytest.fixture
+def fake_hash_durations(monkeypatch: pytest.MonkeyPatch) -> dict[int, float]:
+    """Make each calibration hash take the configured number of seconds per cost, without hashing."""
+    durations: dict[int, float] = {}
+    clock = 0.0
+
+    def perf_counter() -> float:
+        return clock
+
+    def hashpw(password: bytes, salt: bytes) -> bytes:
+        nonlocal clock
+        clock += durations[int(salt[4:6])]
+        return salt
+
+    monkeypatch.setattr(security.time, "perf_counter", perf_counter)
+    monkeypatch.setattr(security.bcrypt, "hashpw", hashpw)
+    return durations
+
+
+def test_calibrate_returns_first_cost_reaching_target(fake_hash_durations: dict[int, float]) -> None:
+    fake_hash_durations.update({10: 0.06, 11: 0.12, 12: 0.25, 13: 0.5})
+
+    assert security.calibrate_bcrypt_cost(target_seconds=0.25, costs=range(10, 14)) == 12
+
+
+def test_calibrate_falls_back_to_highest_cost(fake_hash_durations: dict[int, float]) -> None:
+    fake_hash_durations.update({10: 0.01, 11: 0.02, 12: 0.04})
+
+    assert security.calibrate_bcrypt_cost(target_seconds=0.25, costs=range(10, 13)) == 12
+
+
+def test_calibrate_without_candidates_keeps_configured_cost(fake_hash_durations: dict[int, float]) -> None:
+    assert security.calibrate_bcrypt_cost(costs=()) == security.settings.bcrypt_cost